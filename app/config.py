@@ -0,0 +1,40 @@
+"""
+App Config — every environment variable the app reads, loaded once at import.
+
+Values never change after process start, so request handlers import
+these constants instead of calling os.getenv() on each request.
+"""
+
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+# ------------------------------------------------------------------ #
+#  Bolna AI                                                           #
+# ------------------------------------------------------------------ #
+BOLNA_API_KEY = os.getenv("BOLNA_API_KEY", "")
+BOLNA_AGENT_ID = os.getenv("BOLNA_AGENT_ID", "")
+BOLNA_FROM_NUMBER = os.getenv("BOLNA_FROM_NUMBER", "")
+WEBHOOK_BASE_URL = os.getenv("WEBHOOK_BASE_URL", "http://localhost:8000")
+
+# Outbound call micro-batching — see BolnaService._dispatch_calls
+BOLNA_CALL_BATCH_SIZE = int(os.getenv("BOLNA_CALL_BATCH_SIZE", "20"))
+BOLNA_CALL_BATCH_WINDOW_MS = int(os.getenv("BOLNA_CALL_BATCH_WINDOW_MS", "10"))
+
+# ------------------------------------------------------------------ #
+#  Calls database                                                     #
+# ------------------------------------------------------------------ #
+# SQLite database URL (you can change this to PostgreSQL, MySQL, etc.)
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Connection pool tuning.
+# Behind PgBouncer in transaction mode use DB_POOL_PRE_PING=false and DB_POOL_RECYCLE=60.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# Log every SQL statement — debugging only, it costs a lot of throughput
+SQLALCHEMY_ECHO = os.getenv("SQLALCHEMY_ECHO", "false").lower() == "true"
@@ -1,14 +1,71 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-import os
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-load_dotenv()
-# SQLite database URL (you can change this to PostgreSQL, MySQL, etc.)
-DATABASE_URL = os.getenv("DATABASE_URL")
+from app.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    SQLALCHEMY_ECHO,
+)
+
+# Plain URLs in .env are mapped onto their async drivers
+_ASYNC_DRIVERS = {
+    "sqlite://": "sqlite+aiosqlite://",
+    "postgresql://": "postgresql+asyncpg://",
+}
+
+
+def _to_async_url(url: str) -> str:
+    """Return the async-driver form of a database URL (no-op if already async)."""
+    for prefix, async_prefix in _ASYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return async_prefix + url[len(prefix):]
+    return url
+
+
+ASYNC_DATABASE_URL = _to_async_url(DATABASE_URL)
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    future=True,
+    echo=SQLALCHEMY_ECHO,
+    # aiosqlite defaults to NullPool (a new connection per checkout); pool explicitly instead
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    # LIFO reuses the most recent connection so idle overflow connections age out
+    pool_use_lifo=True,
+    connect_args={"check_same_thread": False} if ASYNC_DATABASE_URL.startswith("sqlite") else {},
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL + synchronous=NORMAL: webhook commits skip the full fsync and readers don't block on writers."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
+SessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_db():
+    """FastAPI dependency — one AsyncSession per request, closed when the request ends."""
+    async with SessionLocal() as db:
+        yield db
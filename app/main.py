@@ -8,19 +8,22 @@ WHAT CHANGED:
     - Updated /config/check to show Bolna environment variables
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from routes import bolna_routes        # ← was: retell_routes
 from routes import call_tracking_routes
+from app import config
 from app.database import engine
-from app.models import Base
-from dotenv import load_dotenv
+from app.models import Base, Call
+from app.migrate_calls_public_id import needs_migration
 from routes import template_routes
+from services.bolna_service import BolnaConfigError
 
 import logging
-import os
-
-load_dotenv()
 
 # ------------------------------------------------------------------ #
 #  Logging                                                            #
@@ -33,9 +36,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------ #
-#  DB init                                                            #
+#  Lifespan (DB init)                                                 #
 # ------------------------------------------------------------------ #
-Base.metadata.create_all(bind=engine)
+def _check_calls_schema(sync_conn):
+    """Refuse to start on a calls table from before the integer-id schema."""
+    if needs_migration(sync_conn):
+        raise RuntimeError(
+            "The calls table predates the integer primary key / public_id schema. "
+            "Stop the app and run `python -m app.migrate_calls_public_id` once."
+        )
+
+
+def _create_missing_indexes(sync_conn):
+    """create_all() only builds indexes for new tables — add any missing ones."""
+    for index in Call.__table__.indexes:
+        index.create(sync_conn, checkfirst=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with engine.begin() as conn:
+        await conn.run_sync(_check_calls_schema)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+
+    # Open the shared Bolna client under the running loop so the first call doesn't pay for it
+    try:
+        await bolna_routes.get_bolna_service().astart()
+    except BolnaConfigError as e:
+        logger.warning("Bolna service not initialised at startup: %s", e)
+
+    yield
+    await bolna_routes.close_bolna_service()
+    await engine.dispose()
+
 
 # ------------------------------------------------------------------ #
 #  App                                                                #
@@ -49,6 +83,8 @@ app = FastAPI(
     version="4.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -59,6 +95,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (transcripts, call lists); level 5 balances CPU vs ratio
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # ------------------------------------------------------------------ #
 #  Routers                                                            #
 # ------------------------------------------------------------------ #
@@ -94,19 +133,14 @@ def root():
 @app.get("/config/check", tags=["Health"])
 def check_config():
     """Check that all required environment variables are loaded."""
-    bolna_key    = os.getenv("BOLNA_API_KEY", "")
-    agent_id     = os.getenv("BOLNA_AGENT_ID", "")
-    from_number  = os.getenv("BOLNA_FROM_NUMBER", "")
-    webhook_base = os.getenv("WEBHOOK_BASE_URL", "http://localhost:8000")
-
     return {
         "status": "ok",
-        "bolna_api_key_loaded": bool(bolna_key),
-        "bolna_api_key_prefix": bolna_key[:10] + "..." if bolna_key else None,
-        "bolna_agent_id": agent_id or "⚠️  NOT SET — add BOLNA_AGENT_ID to .env",
-        "bolna_from_number": from_number or "⚠️  NOT SET — add BOLNA_FROM_NUMBER to .env",
-        "webhook_base_url": webhook_base,
-        "bolna_webhook_url": f"{webhook_base}/webhook/bolna",
-        "database_url": os.getenv("DATABASE_URL"),
+        "bolna_api_key_loaded": bool(config.BOLNA_API_KEY),
+        "bolna_api_key_prefix": config.BOLNA_API_KEY[:10] + "..." if config.BOLNA_API_KEY else None,
+        "bolna_agent_id": config.BOLNA_AGENT_ID or "⚠️  NOT SET — add BOLNA_AGENT_ID to .env",
+        "bolna_from_number": config.BOLNA_FROM_NUMBER or "⚠️  NOT SET — add BOLNA_FROM_NUMBER to .env",
+        "webhook_base_url": config.WEBHOOK_BASE_URL,
+        "bolna_webhook_url": f"{config.WEBHOOK_BASE_URL}/webhook/bolna",
+        "database_url": config.DATABASE_URL,
         "note": "Set the webhook URL in Bolna Agent → Analytics Tab → Webhook URL",
     }
@@ -0,0 +1,116 @@
+"""
+Migration — calls.id UUID string → INTEGER primary key + calls.public_id.
+
+Databases created before the integer primary key stored the UUID in
+calls.id. This rebuilds the table in the current schema, copying every
+row and keeping the old UUID as public_id, so the IDs already handed out
+by the API (internal_call_id, /api/bolna/calls/{id}) keep working.
+
+Run once, with the app stopped:
+    python -m app.migrate_calls_public_id
+
+Safe to re-run — it does nothing when calls already has public_id.
+Works on SQLite and PostgreSQL (uses DATABASE_URL from .env, plain or with
+an async driver such as sqlite+aiosqlite://).
+"""
+
+import logging
+
+from sqlalchemy import create_engine, event, inspect, text
+
+from app.config import DATABASE_URL
+from app.models import Call
+
+logger = logging.getLogger(__name__)
+
+LEGACY_TABLE = "calls_legacy"
+
+# The migration runs on a sync engine — async driver URLs accepted by
+# app/database.py are mapped back to the default sync driver
+_SYNC_DRIVERS = {
+    "sqlite+aiosqlite://": "sqlite://",
+    "postgresql+asyncpg://": "postgresql://",
+}
+
+# Columns carried over unchanged (everything except the two id columns)
+_COPIED_COLUMNS = [c.name for c in Call.__table__.columns if c.name not in ("id", "public_id")]
+
+
+def _to_sync_url(url: str) -> str:
+    """Return the sync-driver form of a database URL (no-op if already sync)."""
+    for prefix, sync_prefix in _SYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return sync_prefix + url[len(prefix):]
+    return url
+
+
+def needs_migration(sync_conn) -> bool:
+    """True when a calls table exists but predates the public_id column."""
+    inspector = inspect(sync_conn)
+    if not inspector.has_table(Call.__tablename__):
+        return False
+    columns = {c["name"] for c in inspector.get_columns(Call.__tablename__)}
+    return "public_id" not in columns
+
+
+def migrate(sync_conn) -> int:
+    """Rebuild calls in the current schema. Returns the number of rows copied."""
+    if not needs_migration(sync_conn):
+        logger.info("calls already has public_id — nothing to migrate")
+        return 0
+
+    # Old indexes keep their names after the rename and would clash with the new table's
+    for index in inspect(sync_conn).get_indexes(Call.__tablename__):
+        sync_conn.execute(text(f'DROP INDEX "{index["name"]}"'))
+
+    sync_conn.execute(text(f"ALTER TABLE calls RENAME TO {LEGACY_TABLE}"))
+    if sync_conn.dialect.name == "postgresql":
+        sync_conn.execute(
+            text(f"ALTER TABLE {LEGACY_TABLE} RENAME CONSTRAINT calls_pkey TO {LEGACY_TABLE}_pkey")
+        )
+
+    # New table with its indexes, exactly as the model defines them
+    Call.__table__.create(sync_conn)
+
+    column_list = ", ".join(_COPIED_COLUMNS)
+    copied = sync_conn.execute(
+        text(
+            f"INSERT INTO calls (public_id, {column_list}) "
+            f"SELECT id, {column_list} FROM {LEGACY_TABLE} ORDER BY created_at"
+        )
+    ).rowcount
+    sync_conn.execute(text(f"DROP TABLE {LEGACY_TABLE}"))
+    return copied
+
+
+def run(url: str = DATABASE_URL) -> int:
+    """Migrate the database at `url` in one transaction. Returns the number of rows copied."""
+    engine = create_engine(_to_sync_url(url))
+    if engine.dialect.name == "sqlite":
+        # pysqlite only opens a transaction before DML — begin explicitly so
+        # the DROP INDEX / RENAME / CREATE roll back with the copy on failure
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+    # One transaction — on any error the original table is left untouched
+    try:
+        with engine.begin() as conn:
+            return migrate(conn)
+    finally:
+        engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s | %(message)s")
+    copied = run()
+    if copied:
+        logger.info("Migrated %d calls to the integer-id schema", copied)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,8 @@ WHAT CHANGED:
     to work with any calling provider.
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, Boolean
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, Text, DateTime, Integer, Boolean, Index
+from sqlalchemy.orm import declarative_base, deferred
 from app.mssql_database import MssqlBase 
 import uuid
 from datetime import datetime
@@ -21,14 +21,16 @@ Base = declarative_base()
 class Call(Base):
     __tablename__ = "calls"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    public_id = Column(String(36), unique=True, index=True, nullable=False, default=lambda: str(uuid.uuid4()))   # exposed in the API
     lead_id = Column(String)
     lead_name = Column(String)
     lead_phone = Column(String)
     bolna_execution_id = Column(String, nullable=True, index=True)   # was: retell_call_id
     status = Column(String, default="queued")
-    transcript = Column(Text, nullable=True)
-    call_summary = Column(Text, nullable=True)          # from Bolna completed webhook
+    # Large text — deferred so it is only SELECTed when explicitly undeferred
+    transcript = deferred(Column(Text, nullable=True))
+    call_summary = deferred(Column(Text, nullable=True))    # from Bolna completed webhook
     recording_url = Column(String, nullable=True)
     duration_ms = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -37,22 +39,14 @@ class Call(Base):
     callback_time = Column(String, nullable=True)
     stop_sequence = Column(Boolean, default=False)
 
-class CampaignTemplate(Base):
-    __tablename__ = "campaign_templates"
-
-    temp_id = Column(Integer, primary_key=True, autoincrement=True, index=True )
-    user_id = Column(String, default=lambda: str(uuid.uuid4()), index=True, nullable=False)
-    template_name = Column(String(255), nullable=False)
-    industry = Column(String(255), nullable=False)
-    language = Column(String(100), default="en")
-
-    org_name = Column(String(255), nullable=False)
-    caller_name = Column(String(100), nullable=False)
-    call_purpose = Column(Text, nullable=False)
-    call_script = Column(Text, nullable=False)
-
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow,onupdate=datetime.utcnow,nullable=False)
+# Serves list_bolna_calls (WHERE bolna_execution_id IS NOT NULL ORDER BY created_at DESC LIMIT n)
+# straight from the index, without sorting the table.
+Index(
+    "ix_calls_bolna_created_at",
+    Call.created_at.desc(),
+    sqlite_where=Call.bolna_execution_id.isnot(None),
+    postgresql_where=Call.bolna_execution_id.isnot(None),
+)
 
 class AiCallingTemplate(MssqlBase):
     """
@@ -2,16 +2,16 @@
 Pydantic Schemas — request/response validation for the API.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 
 
 class InitiateCallRequest(BaseModel):
     """Payload to start an outbound call with organization and lead context."""
-    orgId: str = Field(..., description="Organization ID")
-    userId: str = Field(..., description="User ID who initiated the call")
-    sequenceId: str = Field(..., description="Sequence or Campaign ID")
+    orgId: Optional[str] = Field(None, description="Organization ID")
+    userId: Optional[str] = Field(None, description="User ID who initiated the call")
+    sequenceId: Optional[str] = Field(None, description="Sequence or Campaign ID")
     leadId: str = Field(..., description="Internal Lead ID")
     leadName: str = Field(..., description="Lead Name")
     leadPhone: str = Field(..., description="Lead Phone Number in E.164 format")
@@ -25,8 +25,11 @@ class InitiateCallRequest(BaseModel):
     agent_id: Optional[str] = None
     from_number: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        str_strip_whitespace=False,   # callingScript can be large — don't copy every string
+        validate_default=False,
+        json_schema_extra={
             "example": {
                 "orgId": "org1",
                 "userId": "user1",
@@ -46,7 +49,14 @@ class InitiateCallRequest(BaseModel):
                 "callerName": "Salesy",
                 "orgName": "Hashtechy",
             }
-        }
+        },
+    )
+
+
+# Warm the schema + validator once at import so the first POST /api/bolna/call
+# doesn't pay for it (also keeps the docs example honest).
+InitiateCallRequest.model_json_schema()
+InitiateCallRequest.model_validate(InitiateCallRequest.model_config["json_schema_extra"]["example"])
 
 
 class ConnectSipTrunkRequest(BaseModel):
@@ -4,23 +4,25 @@ phone numbers, and provider management.
 """
 
 import os
-import json
+import asyncio
+import orjson
 import logging
+import weakref
+import threading
 from typing import Optional, Dict, Any
 from services.call_queue_service import call_queue_manager
 
-from fastapi import APIRouter, HTTPException, Request, Response, UploadFile, File, Form, Depends
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response, UploadFile, File, Form, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import select, update, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from app.database import SessionLocal
+from app.database import SessionLocal, get_db
+from app.mssql_database import get_mssql_session
 from app.models import Call
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 from app.schemas import (
     InitiateCallRequest,
     ConnectSipTrunkRequest,
@@ -35,21 +37,51 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Bolna AI"])
 
-# Singleton BolnaService instance
+# Short-lived cache for GET /api/bolna/calls, keyed by limit.
+# Cleared whenever a listed call changes (initiate / webhook commits).
+_calls_cache: TTLCache = TTLCache(maxsize=16, ttl=2)
+
+# Singleton BolnaService instance (created at startup by the app lifespan)
 _bolna_service: Optional[BolnaService] = None
+_bolna_service_lock = threading.Lock()
 
 
 def get_bolna_service() -> BolnaService:
     global _bolna_service
     if _bolna_service is None:
-        _bolna_service = BolnaService()
+        with _bolna_service_lock:
+            if _bolna_service is None:
+                _bolna_service = BolnaService()
     return _bolna_service
 
 
+async def close_bolna_service() -> None:
+    """Close the shared BolnaService HTTP client (called on app shutdown)."""
+    global _bolna_service
+    if _bolna_service is not None:
+        await _bolna_service.aclose()
+        _bolna_service = None
+
+
+def _envelope_head(key: str, **fields: Any) -> bytes:
+    """Opening bytes of {"success": true, **fields, key: ... — the caller appends the value and b"}"."""
+    return orjson.dumps({"success": True, **fields})[:-1] + b',"' + key.encode() + b'":'
+
+
+def _raw_json_envelope(key: str, raw: bytes, **fields: Any) -> Response:
+    """
+    Build {"success": true, **fields, key: <raw>} around an upstream JSON body
+    without decoding it — the Bolna bytes are spliced in as-is, so large
+    payloads skip the parse / re-encode round-trip.
+    """
+    body = b"".join((_envelope_head(key, **fields), raw or b"null", b"}"))
+    return Response(content=body, media_type="application/json")
+
+
 # ── Call Initiation (with Queue) ──────────────────────────────────────── #
 
 @router.post("/api/bolna/call", summary="Initiate a Bolna AI outbound call")
-async def initiate_bolna_call(request: InitiateCallRequest):
+async def initiate_bolna_call(request: InitiateCallRequest, db: AsyncSession = Depends(get_db)):
     """Creates an outbound call via Bolna AI — with concurrency control."""
 
     # Step 1: Package everything the queue manager needs into a dict
@@ -83,7 +115,6 @@ async def initiate_bolna_call(request: InitiateCallRequest):
         }
 
     # Step 4: Slot was available — actually make the Bolna call
-    db = SessionLocal()
     try:
         # Create DB record
         call = Call(
@@ -93,8 +124,8 @@ async def initiate_bolna_call(request: InitiateCallRequest):
             status="initiated",
         )
         db.add(call)
-        db.commit()
-        db.refresh(call)
+        await db.commit()
+        await db.refresh(call)
 
         # Build user_data for the AI agent context
         user_data = {
@@ -108,7 +139,7 @@ async def initiate_bolna_call(request: InitiateCallRequest):
 
         # Metadata for internal tracking
         metadata = {
-            "internal_call_id": call.id,
+            "internal_call_id": call.public_id,
             "org_id": request.orgId,
             "user_id": request.userId,
             "sequence_id": request.sequenceId,
@@ -118,7 +149,7 @@ async def initiate_bolna_call(request: InitiateCallRequest):
 
         try:
             service = get_bolna_service()
-            bolna_response = service.initiate_call(
+            bolna_response = await service.initiate_call(
                 to_number=request.leadPhone,
                 agent_id=request.agent_id,
                 from_number=request.from_number,
@@ -128,26 +159,27 @@ async def initiate_bolna_call(request: InitiateCallRequest):
         except BolnaConfigError as e:
             # Call failed to start — free the slot we reserved
             await call_queue_manager.on_call_finished("failed")
-            db.delete(call)
-            db.commit()
+            await db.delete(call)
+            await db.commit()
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             # Call failed — free the slot
             await call_queue_manager.on_call_finished("failed")
             call.status = "failed"
-            db.commit()
+            await db.commit()
             logger.error("Bolna call initiation failed: %s", e)
             raise HTTPException(status_code=502, detail=f"Bolna API error: {str(e)}")
 
         # Update DB with Bolna execution ID
         call.bolna_execution_id = bolna_response.get("execution_id") or bolna_response.get("id")
         call.status = bolna_response.get("status", "queued")
-        db.commit()
+        await db.commit()
+        _calls_cache.clear()
 
         return {
             "success": True,
             "status": "started",
-            "internal_call_id": call.id,
+            "internal_call_id": call.public_id,
             "bolna_execution_id": call.bolna_execution_id,
             "active_calls": queue_result["active_calls"],
             "message": f"Call to {request.leadName} initiated successfully.",
@@ -156,171 +188,218 @@ async def initiate_bolna_call(request: InitiateCallRequest):
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         # Free the slot on any unexpected error
         await call_queue_manager.on_call_finished("error")
         logger.error("Failed to initiate call: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to initiate call: {str(e)}")
-    finally:
-        db.close()
 
 
 
 # ── Webhook ──────────────────────────────────────────────────────────── #
 
-@router.post("/webhook/bolna", summary="Bolna AI webhook — receives call events", status_code=204)
-async def bolna_webhook(request: Request):
-    """Bolna POSTs status updates here as the call progresses."""
-    body_bytes = await request.body()
-    body_str = body_bytes.decode("utf-8")
+# Bolna sends extracted_data values like "interest_level: medium" or
+# "callback_requested: true" — strip the key prefix and convert to proper types
+_TRUE_STRINGS = frozenset({"true", "yes", "1"})
 
-    try:
-        data = json.loads(body_str)
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid JSON body")
 
-    execution_id = data.get("execution_id") or data.get("id")
-    status = data.get("status", "unknown")
+def _clean_value(val):
+    """Extract the actual value from Bolna's 'key: value' string format."""
+    if not isinstance(val, str):
+        return val
+    # If it contains ":", take only the part after the last ":"
+    if ":" in val:
+        val = val.split(":")[-1].strip()
+    return val
 
-    if not execution_id:
-        logger.warning("Webhook received without execution_id")
-        return Response(status_code=204)
 
-    logger.info("Bolna webhook | execution_id=%s | status=%s", execution_id, status)
+def _to_bool(val):
+    """Convert string/bool to Python boolean for DB."""
+    if isinstance(val, bool):
+        return val
+    val = _clean_value(val)
+    return str(val).lower() in _TRUE_STRINGS
 
-    db = SessionLocal()
-    try:
-        call = db.query(Call).filter(Call.bolna_execution_id == execution_id).first()
-        if not call:
-            logger.debug("No matching call for execution_id=%s", execution_id)
-            return Response(status_code=204)
-
-        if status == "in-progress":
-            call.status = "ongoing"
-
-        elif status == "call-disconnected":
-            call.status = "ended"
-            call.transcript = data.get("transcript")
-            telephony = data.get("telephony_data") or {}
-            duration_sec = telephony.get("duration") or data.get("conversation_time")
-            if duration_sec:
-                call.duration_ms = int(float(duration_sec) * 1000)
-
-        elif status == "completed":
-            call.status = "completed"
-
-            if data.get("transcript") and not call.transcript:
-                call.transcript = data.get("transcript")
-
-            telephony = data.get("telephony_data") or {}
-            call.recording_url = telephony.get("recording_url")
-
-            duration_sec = telephony.get("duration") or data.get("conversation_time")
-            if duration_sec and not call.duration_ms:
-                call.duration_ms = int(float(duration_sec) * 1000)
-
-            call.call_summary = data.get("summary") or data.get("call_summary")
-
-            extracted = data.get("extracted_data") or {}
-            if extracted:
-                # Bolna sends values like "interest_level: medium" or "callback_requested: true"
-                # We need to clean them — strip the key prefix and convert to proper types
-                def clean_value(val):
-                    """Extract the actual value from Bolna's 'key: value' string format."""
-                    if not isinstance(val, str):
-                        return val
-                    # If it contains ":", take only the part after the last ":"
-                    if ":" in val:
-                        val = val.split(":")[-1].strip()
-                    return val
-
-                def to_bool(val):
-                    """Convert string/bool to Python boolean for DB."""
-                    if isinstance(val, bool):
-                        return val
-                    val = clean_value(val)
-                    return str(val).lower() in ("true", "yes", "1")
-
-                call.interest_level = clean_value(extracted.get("interest_level"))
-                call.callback_requested = to_bool(extracted.get("callback_requested", False))
-                call.callback_time = clean_value(extracted.get("callback_time"))
-                call.stop_sequence = to_bool(extracted.get("stop_sequence", False))
-
-            logger.info(
-                "Call completed | execution_id=%s | interest=%s",
-                execution_id, call.interest_level,
-            )
 
-        else:
-            call.status = status
-            logger.debug("Bolna status update: %s for %s", status, execution_id)
+# One lock per execution_id while it has events in flight (entries drop out
+# once no task holds the lock) — background tasks would otherwise commit
+# events for the same call in any order
+_execution_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
 
-        db.commit()
 
-        # ── QUEUE: free a slot when call reaches a terminal state ──
-        if status in ("completed", "call-disconnected"):
-            next_request = await call_queue_manager.on_call_finished(execution_id)
+def _execution_lock(execution_id: str) -> asyncio.Lock:
+    lock = _execution_locks.get(execution_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _execution_locks[execution_id] = lock
+    return lock
 
-            # If someone was waiting in the queue, start their call now
-            if next_request:
-                logger.info("Starting queued call for lead=%s", next_request.get("leadName"))
-                try:
-                    service = get_bolna_service()
 
-                    # Create a DB record for the queued lead
-                    queued_call = Call(
-                        lead_id=next_request.get("leadId"),
-                        lead_name=next_request.get("leadName"),
-                        lead_phone=next_request.get("leadPhone"),
-                        status="initiated",
+async def apply_call_update(execution_id: str, status: str, data: Dict[str, Any]) -> None:
+    """
+    Apply one Bolna webhook event to its Call row, then start the next queued
+    call if this event freed a slot. Runs as a background task with its own
+    session, after the webhook has already been acknowledged.
+    """
+    async with SessionLocal() as db:
+        try:
+            # Build the column updates for this event and apply them in one UPDATE
+            updates: Dict[str, Any] = {}
+
+            if status == "in-progress":
+                updates["status"] = "ongoing"
+
+            elif status == "call-disconnected":
+                updates["status"] = "ended"
+                updates["transcript"] = data.get("transcript")
+                telephony = data.get("telephony_data") or {}
+                duration_sec = telephony.get("duration") or data.get("conversation_time")
+                if duration_sec:
+                    updates["duration_ms"] = int(float(duration_sec) * 1000)
+
+            elif status == "completed":
+                updates["status"] = "completed"
+
+                # Keep an existing transcript / duration — only fill them when empty
+                if data.get("transcript"):
+                    updates["transcript"] = func.coalesce(
+                        func.nullif(Call.transcript, ""), data.get("transcript")
                     )
-                    db.add(queued_call)
-                    db.commit()
-                    db.refresh(queued_call)
-
-                    user_data = {
-                        "leadName": next_request.get("leadName"),
-                        "leadCompany": next_request.get("leadCompany") or "N/A",
-                        "callPurpose": next_request.get("callPurpose"),
-                        "callingScript": next_request.get("callingScript"),
-                        "callerName": next_request.get("callerName"),
-                        "orgName": next_request.get("orgName"),
-                    }
-                    metadata = {
-                        "internal_call_id": queued_call.id,
-                        "org_id": next_request.get("orgId"),
-                        "user_id": next_request.get("userId"),
-                        "sequence_id": next_request.get("sequenceId"),
-                        "lead_id": next_request.get("leadId"),
-                        "language": next_request.get("language"),
-                    }
-
-                    bolna_response = service.initiate_call(
-                        to_number=next_request["leadPhone"],
-                        agent_id=next_request.get("agent_id"),
-                        from_number=next_request.get("from_number"),
-                        metadata=metadata,
-                        user_data=user_data,
+
+                telephony = data.get("telephony_data") or {}
+                updates["recording_url"] = telephony.get("recording_url")
+
+                duration_sec = telephony.get("duration") or data.get("conversation_time")
+                if duration_sec:
+                    updates["duration_ms"] = func.coalesce(
+                        func.nullif(Call.duration_ms, 0), int(float(duration_sec) * 1000)
                     )
-                    queued_call.bolna_execution_id = bolna_response.get("execution_id") or bolna_response.get("id")
-                    queued_call.status = bolna_response.get("status", "queued")
-                    db.commit()
+
+                updates["call_summary"] = data.get("summary") or data.get("call_summary")
+
+                extracted = data.get("extracted_data") or {}
+                if extracted:
+                    updates["interest_level"] = _clean_value(extracted.get("interest_level"))
+                    updates["callback_requested"] = _to_bool(extracted.get("callback_requested", False))
+                    updates["callback_time"] = _clean_value(extracted.get("callback_time"))
+                    updates["stop_sequence"] = _to_bool(extracted.get("stop_sequence", False))
+
+            else:
+                updates["status"] = status
+                logger.debug("Bolna status update: %s for %s", status, execution_id)
+
+            stmt = update(Call).where(Call.bolna_execution_id == execution_id)
+            if status != "completed":
+                # A late event must never downgrade a completed call
+                stmt = stmt.where(or_(Call.status.is_(None), Call.status != "completed"))
+
+            # Events for one call are applied one at a time, in arrival order
+            async with _execution_lock(execution_id):
+                result = await db.execute(
+                    stmt.values(**updates).execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
+                    logger.debug(
+                        "No matching (or already completed) call for execution_id=%s",
+                        execution_id,
+                    )
+                    return
+
+                if status == "completed":
                     logger.info(
-                        "Queued call started | lead=%s | execution_id=%s",
-                        next_request.get("leadName"), queued_call.bolna_execution_id,
+                        "Call completed | execution_id=%s | interest=%s",
+                        execution_id, updates.get("interest_level"),
                     )
 
-                except Exception as e:
-                    logger.error("Failed to start queued call: %s", e)
-                    # Free the slot so the queue doesn't get stuck
-                    await call_queue_manager.on_call_finished("queued-failed")
+                await db.commit()
+            _calls_cache.clear()
+
+            # ── QUEUE: free a slot when call reaches a terminal state ──
+            if status in ("completed", "call-disconnected"):
+                next_request = await call_queue_manager.on_call_finished(execution_id)
+
+                # If someone was waiting in the queue, start their call now
+                if next_request:
+                    logger.info("Starting queued call for lead=%s", next_request.get("leadName"))
+                    try:
+                        service = get_bolna_service()
+
+                        # Create a DB record for the queued lead
+                        queued_call = Call(
+                            lead_id=next_request.get("leadId"),
+                            lead_name=next_request.get("leadName"),
+                            lead_phone=next_request.get("leadPhone"),
+                            status="initiated",
+                        )
+                        db.add(queued_call)
+                        await db.commit()
+                        await db.refresh(queued_call)
+
+                        user_data = {
+                            "leadName": next_request.get("leadName"),
+                            "leadCompany": next_request.get("leadCompany") or "N/A",
+                            "callPurpose": next_request.get("callPurpose"),
+                            "callingScript": next_request.get("callingScript"),
+                            "callerName": next_request.get("callerName"),
+                            "orgName": next_request.get("orgName"),
+                        }
+                        metadata = {
+                            "internal_call_id": queued_call.public_id,
+                            "org_id": next_request.get("orgId"),
+                            "user_id": next_request.get("userId"),
+                            "sequence_id": next_request.get("sequenceId"),
+                            "lead_id": next_request.get("leadId"),
+                            "language": next_request.get("language"),
+                        }
+
+                        bolna_response = await service.initiate_call(
+                            to_number=next_request["leadPhone"],
+                            agent_id=next_request.get("agent_id"),
+                            from_number=next_request.get("from_number"),
+                            metadata=metadata,
+                            user_data=user_data,
+                        )
+                        queued_call.bolna_execution_id = bolna_response.get("execution_id") or bolna_response.get("id")
+                        queued_call.status = bolna_response.get("status", "queued")
+                        await db.commit()
+                        _calls_cache.clear()
+                        logger.info(
+                            "Queued call started | lead=%s | execution_id=%s",
+                            next_request.get("leadName"), queued_call.bolna_execution_id,
+                        )
+
+                    except Exception as e:
+                        logger.error("Failed to start queued call: %s", e)
+                        # Free the slot so the queue doesn't get stuck
+                        await call_queue_manager.on_call_finished("queued-failed")
+
+        except Exception as e:
+            logger.error("Webhook processing error: %s", e)
+            await db.rollback()
 
-    except Exception as e:
-        logger.error("Webhook processing error: %s", e)
-        db.rollback()
-    finally:
-        db.close()
 
+@router.post("/webhook/bolna", summary="Bolna AI webhook — receives call events", status_code=204)
+async def bolna_webhook(request: Request, background: BackgroundTasks):
+    """Bolna POSTs status updates here as the call progresses."""
+    body_bytes = await request.body()
+
+    try:
+        # orjson parses the raw bytes directly — no intermediate UTF-8 decode
+        data = orjson.loads(body_bytes)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+    execution_id = data.get("execution_id") or data.get("id")
+    status = data.get("status", "unknown")
+
+    if not execution_id:
+        logger.warning("Webhook received without execution_id")
+        return Response(status_code=204)
+
+    logger.info("Bolna webhook | execution_id=%s | status=%s", execution_id, status)
+
+    # Ack straight away — the DB write and queue drain run after the response is sent
+    background.add_task(apply_call_update, execution_id, status, data)
     return Response(status_code=204)
 
 
@@ -338,108 +417,120 @@ async def get_queue_status():
 # ── Call History ─────────────────────────────────────────────────────── #
 
 @router.get("/api/bolna/calls", summary="List all Bolna AI calls")
-async def list_bolna_calls(limit: int = 50):
+async def list_bolna_calls(limit: int = 50, db: AsyncSession = Depends(get_db)):
     """Returns all calls initiated via Bolna, newest first."""
-    db = SessionLocal()
-    try:
-        calls = (
-            db.query(Call)
-            .filter(Call.bolna_execution_id.isnot(None))
+    cached = _calls_cache.get(limit)
+    if cached is not None:
+        return cached
+
+    # Select only the listed columns — transcript/summary are reduced to
+    # SQL flags instead of loading the full text for every row
+    rows = (
+        await db.execute(
+            select(
+                Call.public_id,
+                Call.bolna_execution_id,
+                Call.lead_name,
+                Call.lead_phone,
+                Call.status,
+                Call.duration_ms,
+                and_(Call.transcript.isnot(None), Call.transcript != "").label("has_transcript"),
+                and_(Call.call_summary.isnot(None), Call.call_summary != "").label("has_summary"),
+                Call.recording_url,
+                Call.interest_level,
+                Call.callback_requested,
+                Call.created_at,
+            )
+            .where(Call.bolna_execution_id.isnot(None))
             .order_by(Call.created_at.desc())
             .limit(limit)
-            .all()
         )
-        return {
-            "total": len(calls),
-            "calls": [
-                {
-                    "id": c.id,
-                    "bolna_execution_id": c.bolna_execution_id,
-                    "lead_name": c.lead_name,
-                    "lead_phone": c.lead_phone,
-                    "status": c.status,
-                    "duration_ms": c.duration_ms,
-                    "has_transcript": bool(c.transcript),
-                    "has_summary": bool(c.call_summary),
-                    "recording_url": c.recording_url,
-                    "interest_level": c.interest_level,
-                    "callback_requested": c.callback_requested,
-                    "created_at": c.created_at.isoformat() if c.created_at else None,
-                }
-                for c in calls
-            ],
-        }
-    finally:
-        db.close()
+    ).all()
+    result = {
+        "total": len(rows),
+        "calls": [
+            {
+                "id": r.public_id,
+                "bolna_execution_id": r.bolna_execution_id,
+                "lead_name": r.lead_name,
+                "lead_phone": r.lead_phone,
+                "status": r.status,
+                "duration_ms": r.duration_ms,
+                "has_transcript": bool(r.has_transcript),
+                "has_summary": bool(r.has_summary),
+                "recording_url": r.recording_url,
+                "interest_level": r.interest_level,
+                "callback_requested": r.callback_requested,
+                "created_at": r.created_at,
+            }
+            for r in rows
+        ],
+    }
+    _calls_cache[limit] = result
+    return result
 
 
 @router.get("/api/bolna/metrics", summary="Get overall calling performance metrics")
-async def get_bolna_metrics():
+async def get_bolna_metrics(db: AsyncSession = Depends(get_db)):
     """Returns aggregated performance metrics for dashboard (total calls, duration, interest levels)."""
-    db = SessionLocal()
-    try:
-        calls = db.query(Call).filter(Call.bolna_execution_id.isnot(None)).all()
-        
-        total_calls = len(calls)
-        connected_calls = sum(1 for c in calls if c.status == "completed" or c.status == "ended")
-        
-        # Bolna returns duration in MS
-        total_duration_ms = sum(c.duration_ms for c in calls if c.duration_ms)
-        total_duration_minutes = round(total_duration_ms / 60000, 2)
-        
-        # Interest breakdown
-        interest_stats = {
-            "high": sum(1 for c in calls if str(c.interest_level).lower() == "high"),
-            "medium": sum(1 for c in calls if str(c.interest_level).lower() == "medium"),
-            "low": sum(1 for c in calls if str(c.interest_level).lower() == "low"),
-            "unknown": sum(1 for c in calls if not c.interest_level or str(c.interest_level).lower() not in ["high", "medium", "low"])
-        }
-        
-        return {
-            "success": True,
-            "metrics": {
-                "total_calls": total_calls,
-                "connected_calls": connected_calls,
-                "connection_rate_pct": round((connected_calls / total_calls * 100), 1) if total_calls > 0 else 0,
-                "total_duration_minutes": total_duration_minutes,
-                "interest_breakdown": interest_stats,
-            }
+    calls = (await db.scalars(select(Call).where(Call.bolna_execution_id.isnot(None)))).all()
+    
+    total_calls = len(calls)
+    connected_calls = sum(1 for c in calls if c.status == "completed" or c.status == "ended")
+    
+    # Bolna returns duration in MS
+    total_duration_ms = sum(c.duration_ms for c in calls if c.duration_ms)
+    total_duration_minutes = round(total_duration_ms / 60000, 2)
+    
+    # Interest breakdown
+    interest_stats = {
+        "high": sum(1 for c in calls if str(c.interest_level).lower() == "high"),
+        "medium": sum(1 for c in calls if str(c.interest_level).lower() == "medium"),
+        "low": sum(1 for c in calls if str(c.interest_level).lower() == "low"),
+        "unknown": sum(1 for c in calls if not c.interest_level or str(c.interest_level).lower() not in ["high", "medium", "low"])
+    }
+    
+    return {
+        "success": True,
+        "metrics": {
+            "total_calls": total_calls,
+            "connected_calls": connected_calls,
+            "connection_rate_pct": round((connected_calls / total_calls * 100), 1) if total_calls > 0 else 0,
+            "total_duration_minutes": total_duration_minutes,
+            "interest_breakdown": interest_stats,
         }
-    finally:
-        db.close()
+    }
 
 
 @router.get("/api/bolna/calls/{call_id}", summary="Get a Bolna AI call with full transcript")
-async def get_bolna_call(call_id: str):
-    """Retrieve a single call record by internal DB ID or Bolna execution ID."""
-    db = SessionLocal()
-    try:
-        call = (
-            db.query(Call).filter(Call.id == call_id).first()
-            or db.query(Call).filter(Call.bolna_execution_id == call_id).first()
-        )
-        if not call:
-            raise HTTPException(status_code=404, detail="Call not found")
+async def get_bolna_call(call_id: str, db: AsyncSession = Depends(get_db)):
+    """Retrieve a single call record by its public call ID or Bolna execution ID."""
+    call = await db.scalar(
+        select(Call)
+        .where(or_(Call.public_id == call_id, Call.bolna_execution_id == call_id))
+        .options(undefer(Call.transcript), undefer(Call.call_summary))
+        .limit(1)
+    )
+    if not call:
+        raise HTTPException(status_code=404, detail="Call not found")
 
-        return {
-            "id": call.id,
-            "bolna_execution_id": call.bolna_execution_id,
-            "lead_id": call.lead_id,
-            "lead_name": call.lead_name,
-            "lead_phone": call.lead_phone,
-            "status": call.status,
-            "duration_ms": call.duration_ms,
-            "transcript": call.transcript,
-            "call_summary": call.call_summary,
-            "recording_url": call.recording_url,
-            "interest_level": call.interest_level,
-            "callback_requested": call.callback_requested,
-            "callback_time": call.callback_time,
-            "stop_sequence": call.stop_sequence,
-            "created_at": call.created_at.isoformat() if call.created_at else None,
-        }
-    finally:
-        db.close()
+    return {
+        "id": call.public_id,
+        "bolna_execution_id": call.bolna_execution_id,
+        "lead_id": call.lead_id,
+        "lead_name": call.lead_name,
+        "lead_phone": call.lead_phone,
+        "status": call.status,
+        "duration_ms": call.duration_ms,
+        "transcript": call.transcript,
+        "call_summary": call.call_summary,
+        "recording_url": call.recording_url,
+        "interest_level": call.interest_level,
+        "callback_requested": call.callback_requested,
+        "callback_time": call.callback_time,
+        "stop_sequence": call.stop_sequence,
+        "created_at": call.created_at,
+    }
 
 
 # ── SIP Trunk Management ────────────────────────────────────────────── #
@@ -455,7 +546,7 @@ async def connect_sip_trunk(request: ConnectSipTrunkRequest):
             raise HTTPException(status_code=400, detail="Invalid phone number")
 
         service = get_bolna_service()
-        result = service.create_sip_trunk(
+        result = await service.create_sip_trunk(
             name=request.name,
             provider=request.provider,
             phone_number=request.phone_number,
@@ -489,12 +580,14 @@ async def list_sip_trunks():
     """Returns all SIP trunks connected to your Bolna account."""
     try:
         service = get_bolna_service()
-        trunks = service.list_sip_trunks()
-        return {
+        trunks = await service.list_sip_trunks()
+        # Return the response directly — orjson encodes the upstream list in
+        # one pass and FastAPI's jsonable_encoder walk is skipped
+        return ORJSONResponse({
             "success": True,
             "count": len(trunks) if isinstance(trunks, list) else 0,
             "sip_trunks": trunks,
-        }
+        })
     except Exception as e:
         logger.error("Failed to list SIP trunks: %s", e)
         raise HTTPException(status_code=502, detail=str(e))
@@ -509,7 +602,7 @@ async def update_sip_trunk(trunk_id: str, request: Request):
     try:
         body = await request.json()
         service = get_bolna_service()
-        result = service.update_sip_trunk(trunk_id, body)
+        result = await service.update_sip_trunk(trunk_id, body)
         return {"success": True, "trunk": result}
     except Exception as e:
         logger.error("SIP trunk update failed: %s", e)
@@ -526,7 +619,7 @@ async def buy_phone_number(request: BuyPhoneNumberRequest):
     """Buy a virtual phone number from Bolna."""
     try:
         service = get_bolna_service()
-        result = service.buy_phone_number(
+        result = await service.buy_phone_number(
             country=request.country,
             phone_number=request.phone_number,
         )
@@ -548,7 +641,7 @@ async def search_phone_numbers(country: str = "IN"):
     """Search for available phone numbers by country."""
     try:
         service = get_bolna_service()
-        numbers = service.search_phone_numbers(country=country)
+        numbers = await service.search_phone_numbers(country=country)
         return {"success": True, "available_numbers": numbers}
     except Exception as e:
         logger.error("Phone number search failed: %s", e)
@@ -563,12 +656,13 @@ async def list_phone_numbers():
     """Returns all phone numbers linked to your Bolna account."""
     try:
         service = get_bolna_service()
-        numbers = service.list_phone_numbers()
-        return {
+        numbers = await service.list_phone_numbers()
+        # Returned directly, as in list_sip_trunks
+        return ORJSONResponse({
             "success": True,
             "count": len(numbers) if isinstance(numbers, list) else 0,
             "phone_numbers": numbers,
-        }
+        })
     except Exception as e:
         logger.error("Failed to list phone numbers: %s", e)
         raise HTTPException(status_code=502, detail=str(e))
@@ -583,7 +677,7 @@ async def delete_phone_number(number_id: str):
     """Delete a phone number from your Bolna account."""
     try:
         service = get_bolna_service()
-        service.delete_phone_number(number_id)
+        await service.delete_phone_number(number_id)
         return {
             "success": True,
             "message": f"Phone number {number_id} has been removed from Bolna.",
@@ -639,7 +733,7 @@ async def connect_provider(request: ConnectProviderRequest):
     """Connect a business's telephony provider credentials to Bolna."""
     try:
         service = get_bolna_service()
-        result = service.connect_provider(
+        result = await service.connect_provider(
             provider=request.provider,
             credentials=request.credentials,
         )
@@ -673,7 +767,7 @@ async def list_providers():
     """Returns all provider credentials currently linked to Bolna (values masked)."""
     try:
         service = get_bolna_service()
-        result = service.list_providers()
+        result = await service.list_providers()
         return {
             "success": True,
             "providers": result,
@@ -691,7 +785,7 @@ async def delete_provider(provider_id: str):
     """Delete a single provider credential from Bolna by its ID."""
     try:
         service = get_bolna_service()
-        service.delete_provider(provider_id)
+        await service.delete_provider(provider_id)
         return {
             "success": True,
             "message": f"Provider credential {provider_id} deleted.",
@@ -715,7 +809,7 @@ async def disconnect_provider(provider: str):
     """
     try:
         service = get_bolna_service()
-        result = service.disconnect_provider(provider)
+        result = await service.disconnect_provider(provider)
         return {
             "success": True,
             "message": f"Provider '{provider}' disconnected — {result['credentials_deleted']} credentials removed.",
@@ -729,12 +823,20 @@ async def disconnect_provider(provider: str):
 
 # ── Batch ──────────────────────────────────────────────────────────── #
 
+def _load_template(template_id: int):
+    """Fetch one AiCallingTemplate from SQL Server with a short-lived session (sync)."""
+    db = get_mssql_session()
+    try:
+        return get_template(db, template_id)
+    finally:
+        db.close()
+
+
 @router.post("/api/bolna/batches", summary="Create a batch call campaign from a CSV File")
 async def create_batch(
     agent_id: Optional[str] = Form(None),
     template_id: Optional[int] = Form(None),
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
 ):
     try:
         csv_bytes = await file.read()
@@ -742,7 +844,9 @@ async def create_batch(
 
         template_data = None
         if template_id:
-            db_template = get_template(db, temp_id=template_id)
+            # SQL Server is only needed for templated batches, and pyodbc is
+            # blocking — open the session and query off the event loop
+            db_template = await run_in_threadpool(_load_template, template_id)
             if not db_template:
                 raise HTTPException(status_code=404, detail=f"Template {template_id} not found")
                 
@@ -757,7 +861,7 @@ async def create_batch(
             }
             logger.info("Loaded template '%s' for batch", template_data["template_name"])
 
-        result = service.create_batch(
+        result = await service.create_batch(
             csv_bytes=csv_bytes,
             filename=file.filename,
             agent_id=agent_id,
@@ -770,6 +874,8 @@ async def create_batch(
             "bolna_response": result,
         }
 
+    except HTTPException:
+        raise
     except BolnaConfigError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -779,7 +885,7 @@ async def create_batch(
 async def schedule_batch(batch_id: str, request: ScheduleBatchRequest):
     try:
         service = get_bolna_service()
-        result = service.schedule_batch(
+        result = await service.schedule_batch(
             batch_id=batch_id,
             scheduled_at=request.scheduled_at,
         )
@@ -798,8 +904,8 @@ async def schedule_batch(batch_id: str, request: ScheduleBatchRequest):
 async def list_batches():
     try:
         service = get_bolna_service()
-        result = service.list_batches()
-        return {"success": True, "batches": result}
+        raw = await service.list_batches(raw=True)
+        return _raw_json_envelope("batches", raw)
     except Exception as e:
         logger.error("Failed to list batches: %s", e)
         raise HTTPException(status_code=502, detail=str(e))
@@ -808,8 +914,8 @@ async def list_batches():
 async def get_batch(batch_id: str):
     try:
         service = get_bolna_service()
-        result = service.get_batch(batch_id)
-        return {"success": True, "batch": result}
+        raw = await service.get_batch(batch_id, raw=True)
+        return _raw_json_envelope("batch", raw)
     except Exception as e:
         logger.error("Failed to get batch: %s", e)
         raise HTTPException(status_code=502, detail=str(e))
@@ -818,7 +924,7 @@ async def get_batch(batch_id: str):
 async def stop_batch(batch_id: str):
     try:
         service = get_bolna_service()
-        result = service.stop_batch(batch_id)
+        result = await service.stop_batch(batch_id)
         return {
             "success": True,
             "batch_id": batch_id,
@@ -831,10 +937,31 @@ async def stop_batch(batch_id: str):
 
 @router.get("/api/bolna/batches/{batch_id}/executions", summary="Get all executions for a batch")
 async def get_batch_executions(batch_id: str):
+    """
+    Streams Bolna's execution list for a batch. Upstream errors before the
+    first byte return 502; a failure mid-stream aborts the response.
+    """
     try:
         service = get_bolna_service()
-        result = service.get_batch_executions(batch_id)
-        return {"success": True,"batch_id":batch_id,"executions": result}
+        chunks = service.stream_batch_executions(batch_id)
+        # Pull the first chunk here so upstream errors still become a 502
+        # instead of a truncated 200 stream
+        first = await anext(chunks, b"")
     except Exception as e:
         logger.error("Failed to get batch executions: %s", e)
-        raise HTTPException(status_code=502, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=502, detail=str(e))
+
+    async def body():
+        # Relay Bolna's bytes as they arrive, wrapped in our envelope.
+        # The 200 status is already sent by now — if Bolna fails mid-body the
+        # stream is cut short and the client gets incomplete JSON, so log it.
+        yield _envelope_head("executions", batch_id=batch_id) + (first or b"null")
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            logger.error("Batch executions stream cut short | batch_id=%s | %s", batch_id, e)
+            raise
+        yield b"}"
+
+    return StreamingResponse(body(), media_type="application/json")
\ No newline at end of file
@@ -1,10 +1,13 @@
 """
 BolnaService — HTTP wrapper around the Bolna AI REST API.
 
-Uses httpx for direct REST API calls (Bolna has no Python SDK).
+Uses a shared httpx.AsyncClient for direct REST API calls (Bolna has no
+Python SDK). Every API method is a coroutine — callers must await it.
 
 Endpoints:
     - initiate_call()        → POST /call
+    - initiate_calls_bulk()  → POST /call  (concurrent, one per spec)
+    - prepare_dialer()       → POST /call  (fixed agent / caller number)
     - get_execution()        → GET  /executions/{id}
     - list_agents()          → GET  /agent/all
     - buy_phone_number()     → POST /phone-numbers/buy
@@ -22,51 +25,226 @@ Endpoints:
     - get_batch()            → GET  /batches/{id}
     - list_batches()         → GET  /batches
     - stop_batch()           → POST /batches/{id}/stop
-    - get_batch_executions() → GET  /batches/{id}/executions
+    - stream_batch_executions() → GET /batches/{id}/executions  (streamed)
 """
 import io 
 import csv
-import os
+import time
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Union, AsyncIterator, Awaitable, Callable
 
 import httpx
+import orjson
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from app.config import (
+    BOLNA_API_KEY,
+    BOLNA_AGENT_ID,
+    BOLNA_FROM_NUMBER,
+    BOLNA_CALL_BATCH_SIZE,
+    BOLNA_CALL_BATCH_WINDOW_MS,
+)
 
 logger = logging.getLogger(__name__)
 
 BOLNA_BASE_URL = "https://api.bolna.ai"
 
+# Request bodies are pre-encoded with orjson and sent as raw bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Connection pool size — also the cap on concurrent requests in bulk calls
+MAX_CONNECTIONS = 100
+
+# Bulk call initiation: statuses where Bolna rejected the call without
+# placing it, and the exponential backoff applied to them
+RETRYABLE_CALL_STATUSES = frozenset({429, 503})
+BULK_MAX_ATTEMPTS = 3
+BULK_BACKOFF_BASE_SECONDS = 0.5
+
+# How long a fetched phone-number list is reused (seconds)
+PHONE_NUMBERS_CACHE_TTL = 30.0
+
 
 class BolnaConfigError(Exception):
     """Raised when required Bolna env vars are missing."""
 
 
+class BolnaAPIError(Exception):
+    """Raised when Bolna answers with a non-2xx status."""
+
+    def __init__(self, status_code: int, detail: Any):
+        self.status_code = status_code
+        self.detail = detail
+        super().__init__(f"Bolna API error ({status_code}): {detail}")
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """True for failures worth retrying: 429 / 5xx answers and transport errors."""
+    if isinstance(exc, BolnaAPIError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+# Reads can be repeated safely — retry transient failures with jittered
+# backoff so concurrent callers don't retry in lockstep
+_retry_idempotent = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_exponential_jitter(initial=0.1, max=2.0),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+
+# Call creation is not idempotent (Bolna has no idempotency key), and a
+# DELETE that timed out may already have gone through — so only retry
+# when the request never reached Bolna
+_retry_unsent = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_exponential_jitter(initial=0.1, max=2.0),
+    retry=retry_if_exception_type((httpx.ConnectError, httpx.ConnectTimeout)),
+    reraise=True,
+)
+
+
+def _is_unsent_call(exc: BaseException) -> bool:
+    """True when Bolna never placed the call: connect failures and 429 / 503 answers."""
+    if isinstance(exc, BolnaAPIError):
+        return exc.status_code in RETRYABLE_CALL_STATUSES
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+# Bulk call initiation — the single retry layer for those calls, also
+# backing off (jittered) while Bolna is busy (429 / 503)
+_retry_bulk_call = retry(
+    stop=stop_after_attempt(BULK_MAX_ATTEMPTS),
+    wait=wait_exponential_jitter(initial=BULK_BACKOFF_BASE_SECONDS, max=2.0),
+    retry=retry_if_exception(_is_unsent_call),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
+
 class BolnaService:
     """Bolna AI API wrapper. Instantiate once and share across requests."""
 
+    # Fixed attribute set — no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "api_key",
+        "_client",
+        "default_agent_id",
+        "default_from_number",
+        "_call_payload_template",
+        "_call_queue",
+        "_dispatcher_task",
+        "_inflight_batches",
+        "_numbers_cache",
+        "_numbers_lock",
+    )
+
     def __init__(self):
-        self.api_key = os.getenv("BOLNA_API_KEY", "")
+        self.api_key = BOLNA_API_KEY
         if not self.api_key:
             raise BolnaConfigError(
                 "BOLNA_API_KEY is not set. Add it to your .env file. "
                 "Get it from https://platform.bolna.ai/developers"
             )
 
-        self.client = httpx.Client(
+        # Pooled HTTP client, created on first use (see the client property)
+        self._client: Optional[httpx.AsyncClient] = None
+
+        self.default_agent_id = BOLNA_AGENT_ID
+        self.default_from_number = BOLNA_FROM_NUMBER
+
+        # POST /call defaults, resolved once. Read-only so one request's
+        # overrides can never leak into the next.
+        call_defaults: Dict[str, Any] = {}
+        if self.default_agent_id:
+            call_defaults["agent_id"] = self.default_agent_id
+        if self.default_from_number:
+            call_defaults["from_phone_number"] = self.default_from_number
+        self._call_payload_template = MappingProxyType(call_defaults)
+
+        # initiate_call() enqueues (payload, future); the dispatcher task
+        # drains the queue in short windows and sends each burst concurrently.
+        # The task is started on first use, inside the running event loop.
+        self._call_queue: asyncio.Queue = asyncio.Queue()
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._inflight_batches: set = set()
+
+        # list_phone_numbers() cache: (fetched_at, numbers) or None
+        self._numbers_cache: Optional[tuple] = None
+        self._numbers_lock = asyncio.Lock()
+        logger.info("BolnaService initialized (agent_id=%s)", self.default_agent_id)
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """
+        One pooled client for the process lifetime. HTTP/2 lets concurrent
+        calls share a single multiplexed connection to Bolna; keep-alive
+        connections are reused otherwise. Content-Type is left to httpx so
+        JSON, form and multipart bodies share the client.
+        """
+        return httpx.AsyncClient(
             base_url=BOLNA_BASE_URL,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
+            headers={"Authorization": f"Bearer {self.api_key}"},
             timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=50),
         )
 
-        self.default_agent_id = os.getenv("BOLNA_AGENT_ID", "")
-        self.default_from_number = os.getenv("BOLNA_FROM_NUMBER", "")
-        logger.info("BolnaService initialized (agent_id=%s)", self.default_agent_id)
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The shared httpx.AsyncClient. The app lifespan opens it via astart();
+        scripts that skip the lifespan get it built on first access.
+        """
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    async def astart(self) -> None:
+        """Open the HTTP client under the running event loop. Called from the app lifespan."""
+        if self._client is None:
+            self._client = self._build_client()
+        logger.info("Bolna HTTP client started (http2=True)")
 
-    def _check_response(self, response: httpx.Response) -> Dict[str, Any]:
-        """Parse response JSON, raise on non-2xx status."""
+    async def aclose(self) -> None:
+        """
+        Stop the call dispatcher and close the pooled HTTP client. Call once on shutdown.
+        Calls already sent to Bolna are allowed to finish; calls still waiting
+        in the queue fail with BolnaConfigError instead of hanging.
+        """
+        if self._dispatcher_task is not None:
+            self._dispatcher_task.cancel()
+            await asyncio.gather(self._dispatcher_task, return_exceptions=True)
+            self._dispatcher_task = None
+        if self._inflight_batches:
+            await asyncio.gather(*self._inflight_batches, return_exceptions=True)
+        pending = []
+        while not self._call_queue.empty():
+            pending.append(self._call_queue.get_nowait())
+        self._fail_calls(pending)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _check_response(
+        self, response: httpx.Response, raw: bool = False, expect: Optional[type] = None
+    ) -> Any:
+        """
+        Parse response JSON, raise on non-2xx status.
+        With raw=True the undecoded JSON body is returned as bytes instead,
+        after checking it is labelled JSON (it is spliced into our response).
+        With expect (dict / list) set, a body of any other shape raises
+        TypeError instead of failing later inside a caller.
+        """
         if response.status_code >= 400:
             try:
                 error_detail = response.json()
@@ -77,14 +255,95 @@ class BolnaService:
                 response.status_code,
                 error_detail,
             )
-            raise Exception(
-                f"Bolna API error ({response.status_code}): {error_detail}"
+            raise BolnaAPIError(response.status_code, error_detail)
+        if raw:
+            self._require_json(response)
+            return response.content
+        result = orjson.loads(response.content)
+        if expect is not None and not isinstance(result, expect):
+            logger.error(
+                "Unexpected Bolna response shape | path=%s | expected=%s | got=%s",
+                response.request.url.path, expect.__name__, type(result).__name__,
+            )
+            raise TypeError(
+                f"Unexpected Bolna response for {response.request.url.path}: "
+                f"expected {expect.__name__}, got {type(result).__name__}"
             )
-        return response.json()
+        return result
+
+    @staticmethod
+    def _require_json(response: httpx.Response) -> None:
+        """Raise unless a body passed through undecoded is non-empty JSON (not e.g. a proxy's HTML page)."""
+        content_type = response.headers.get("content-type", "")
+        if "json" in content_type and response.content:
+            return
+        logger.error(
+            "Non-JSON Bolna response | path=%s | status=%s | content_type=%s",
+            response.request.url.path, response.status_code, content_type or "-",
+        )
+        raise BolnaAPIError(
+            502, f"Expected a JSON body from {response.request.url.path}, got {content_type or 'no content type'}"
+        )
+
+    @_retry_idempotent
+    async def _get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        expect: Optional[type] = None,
+    ) -> Any:
+        """GET with retries on transient failures; returns the checked response body."""
+        response = await self.client.get(path, params=params)
+        return self._check_response(response, raw=raw, expect=expect)
+
+    @_retry_unsent
+    async def _delete(self, path: str) -> Any:
+        """DELETE, retried only on connect failures; returns the checked response body."""
+        response = await self.client.delete(path)
+        return self._check_response(response)
 
     # ── Calling ──────────────────────────────────────────────────────── #
 
-    def initiate_call(
+    def _call_settings(
+        self, agent_id: Optional[str] = None, from_number: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Agent / caller-number part of a POST /call body — defaults plus overrides."""
+        payload: Dict[str, Any] = dict(self._call_payload_template)
+        if agent_id:
+            payload["agent_id"] = agent_id
+        if from_number:
+            payload["from_phone_number"] = from_number
+
+        if "agent_id" not in payload:
+            raise BolnaConfigError(
+                "No agent_id provided and BOLNA_AGENT_ID is not set in .env."
+            )
+        return payload
+
+    def _build_call_payload(
+        self,
+        to_number: str,
+        agent_id: Optional[str] = None,
+        from_number: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        user_data: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the POST /call body, applying the default agent / caller number."""
+        payload = self._call_settings(agent_id, from_number)
+        payload["recipient_phone_number"] = to_number
+
+        combined_user_data = {}
+        if user_data:
+            combined_user_data.update(user_data)
+        if metadata:
+            combined_user_data.update(metadata)
+        if combined_user_data:
+            payload["user_data"] = combined_user_data
+
+        return payload
+
+    async def initiate_call(
         self,
         to_number: str,
         agent_id: Optional[str] = None,
@@ -102,61 +361,191 @@ class BolnaService:
             metadata:    Extra context merged into user_data
             user_data:   Key-value pairs injected into agent context
         """
-        resolved_agent_id = agent_id or self.default_agent_id
-        resolved_from_number = from_number or self.default_from_number
+        payload = self._build_call_payload(
+            to_number, agent_id, from_number, metadata, user_data
+        )
 
-        if not resolved_agent_id:
-            raise BolnaConfigError(
-                "No agent_id provided and BOLNA_AGENT_ID is not set in .env."
+        # Hot path in bulk dialing — skip building log arguments when INFO is off
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "Initiating Bolna call | to=%s | agent=%s", to_number, payload["agent_id"]
             )
 
-        payload: Dict[str, Any] = {
-            "agent_id": resolved_agent_id,
-            "recipient_phone_number": to_number,
-        }
+        result = await self._submit_call(orjson.dumps(payload))
 
-        if resolved_from_number:
-            payload["from_phone_number"] = resolved_from_number
+        if log_info:
+            logger.info(
+                "Bolna call created | execution_id=%s | status=%s",
+                result.get("execution_id") or result.get("id"),
+                result.get("status"),
+            )
+        return result
 
-        combined_user_data = {}
-        if user_data:
-            combined_user_data.update(user_data)
-        if metadata:
-            combined_user_data.update(metadata)
-        if combined_user_data:
-            payload["user_data"] = combined_user_data
+    def prepare_dialer(
+        self,
+        agent_id: Optional[str] = None,
+        from_number: Optional[str] = None,
+    ) -> Callable[[str], Awaitable[Dict[str, Any]]]:
+        """
+        Return an async dial(to_number) bound to one agent / caller number.
 
-        logger.info(
-            "Initiating Bolna call | to=%s | agent=%s", to_number, resolved_agent_id
-        )
+        For campaigns that place many calls with the same settings: the JSON
+        body prefix is encoded once here, and each dial only appends the
+        escaped destination number before queueing the call.
+
+        Internal — no route uses this. Like initiate_call() it neither takes a
+        call_queue_manager slot nor creates a Call row, so the caller must do
+        both or the call's webhooks are dropped.
+        """
+        payload = self._call_settings(agent_id, from_number)
+
+        # '{"agent_id":...,"from_phone_number":...' + ',"recipient_phone_number":'
+        prefix = orjson.dumps(payload)[:-1] + b',"recipient_phone_number":'
+        submit = self._submit_call
+
+        async def dial(to_number: str) -> Dict[str, Any]:
+            # orjson.dumps quotes and escapes the number
+            return await submit(prefix + orjson.dumps(to_number) + b"}")
+
+        return dial
+
+    @_retry_unsent
+    async def _post_call(self, body: bytes) -> httpx.Response:
+        """POST an already-encoded JSON body to /call."""
+        return await self.client.post("/call", content=body, headers=JSON_HEADERS)
+
+    async def _submit_call(self, body: bytes) -> Dict[str, Any]:
+        """Hand an encoded POST /call body to the dispatcher and wait for Bolna's response."""
+        if self._dispatcher_task is None or self._dispatcher_task.done():
+            self._dispatcher_task = asyncio.create_task(self._dispatch_calls())
+        future = asyncio.get_running_loop().create_future()
+        await self._call_queue.put((body, future))
+        return await future
+
+    @staticmethod
+    def _fail_calls(calls: List[tuple]) -> None:
+        """Fail the futures of calls that will never be sent (service shutting down)."""
+        for _, future in calls:
+            if not future.done():
+                future.set_exception(BolnaConfigError("BolnaService was closed before the call was sent."))
+
+    async def _dispatch_calls(self) -> None:
+        """
+        Send queued calls in concurrent bursts of up to BOLNA_CALL_BATCH_SIZE.
+
+        A call that finds the queue otherwise empty is sent straight away.
+        While a burst is already building (more calls queued behind the
+        first), the dispatcher waits up to BOLNA_CALL_BATCH_WINDOW_MS for
+        stragglers. Bursts run as their own tasks so a slow call never
+        holds up the next one.
+        """
+        loop = asyncio.get_running_loop()
+        window = BOLNA_CALL_BATCH_WINDOW_MS / 1000
+        while True:
+            batch = [await self._call_queue.get()]
+            try:
+                # Take whatever is already waiting — no delay
+                while len(batch) < BOLNA_CALL_BATCH_SIZE and not self._call_queue.empty():
+                    batch.append(self._call_queue.get_nowait())
+
+                # Only a burst in progress is worth holding back for
+                if len(batch) > 1 and window > 0:
+                    deadline = loop.time() + window
+                    while len(batch) < BOLNA_CALL_BATCH_SIZE:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(self._call_queue.get(), remaining))
+                        except asyncio.TimeoutError:
+                            break
+            except asyncio.CancelledError:
+                # Shutting down mid-collection — these calls will never be sent
+                self._fail_calls(batch)
+                raise
+
+            task = asyncio.create_task(self._send_call_batch(batch))
+            self._inflight_batches.add(task)
+            task.add_done_callback(self._inflight_batches.discard)
+
+    async def _send_call_batch(self, batch: List[tuple]) -> None:
+        """POST every call in the batch concurrently; each caller's future is resolved as its call returns."""
+        logger.debug("Dispatching call batch | size=%d", len(batch))
+
+        async def _send(body: bytes, future: asyncio.Future) -> None:
+            try:
+                response = await self._post_call(body)
+                result = self._check_response(response, expect=dict)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+            # The caller may have been cancelled while the request was in flight
+            if not future.done():
+                future.set_result(result)
+
+        await asyncio.gather(*(_send(body, future) for body, future in batch))
 
-        response = self.client.post("/call", json=payload)
-        result = self._check_response(response)
+    @_retry_bulk_call
+    async def _post_call_with_backoff(self, body: bytes) -> Dict[str, Any]:
+        """
+        POST an encoded body to /call, backing off exponentially while Bolna
+        answers 429 / 503. Only unsent calls are retried, so a retry can never
+        dial the same number twice.
+        """
+        response = await self.client.post("/call", content=body, headers=JSON_HEADERS)
+        return self._check_response(response, expect=dict)
+
+    async def initiate_calls_bulk(
+        self, specs: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create many outbound calls concurrently.
 
+        Args:
+            specs: One dict of initiate_call() keyword arguments per call
+
+        Returns:
+            One entry per spec, in the same order — the Bolna response, or the
+            exception raised for that call (one failure doesn't cancel the rest).
+
+        Internal — no route uses this. It bypasses call_queue_manager's
+        concurrency cap and creates no Call rows; a caller must reserve the
+        slots and persist a row per call, or the webhooks are dropped.
+        """
+        # Cap in-flight requests at the connection pool size
+        semaphore = asyncio.Semaphore(MAX_CONNECTIONS)
+
+        async def _initiate(spec: Dict[str, Any]) -> Dict[str, Any]:
+            body = orjson.dumps(self._build_call_payload(**spec))
+            async with semaphore:
+                return await self._post_call_with_backoff(body)
+
+        results = await asyncio.gather(
+            *(_initiate(spec) for spec in specs), return_exceptions=True
+        )
         logger.info(
-            "Bolna call created | execution_id=%s | status=%s",
-            result.get("execution_id") or result.get("id"),
-            result.get("status"),
+            "Bulk call initiation | requested=%d | failed=%d",
+            len(specs), sum(isinstance(r, Exception) for r in results),
         )
-        return result
+        return results
 
     # ── Execution Details ────────────────────────────────────────────── #
 
-    def get_execution(self, execution_id: str) -> Dict[str, Any]:
+    async def get_execution(self, execution_id: str) -> Dict[str, Any]:
         """Fetch call details by execution ID (status, transcript, recording)."""
-        response = self.client.get(f"/executions/{execution_id}")
-        return self._check_response(response)
+        return await self._get(f"/executions/{execution_id}")
 
     # ── Agents ───────────────────────────────────────────────────────── #
 
-    def list_agents(self) -> List[Dict[str, Any]]:
+    async def list_agents(self) -> List[Dict[str, Any]]:
         """List all AI agents in your Bolna account."""
-        response = self.client.get("/agent/all")
-        return self._check_response(response)
+        return await self._get("/agent/all")
 
     # ── Phone Number Management ──────────────────────────────────────── #
 
-    def buy_phone_number(
+    async def buy_phone_number(
         self,
         country: str = "IN",
         phone_number: Optional[str] = None,
@@ -165,28 +554,52 @@ class BolnaService:
         payload: Dict[str, Any] = {"country": country}
         if phone_number:
             payload["phone_number"] = phone_number
-        response = self.client.post("/phone-numbers/buy", json=payload)
+        response = await self.client.post("/phone-numbers/buy", json=payload)
+        self._numbers_cache = None
         return self._check_response(response)
 
-    def search_phone_numbers(self, country: str = "IN") -> List[Dict[str, Any]]:
+    async def search_phone_numbers(self, country: str = "IN") -> List[Dict[str, Any]]:
         """Search available phone numbers by country."""
-        response = self.client.get("/phone-numbers/search", params={"country": country})
-        return self._check_response(response)
+        return await self._get("/phone-numbers/search", params={"country": country})
 
-    def list_phone_numbers(self) -> List[Dict[str, Any]]:
-        """List all phone numbers linked to your Bolna account."""
-        response = self.client.get("/phone-numbers/all")
-        return self._check_response(response)
+    def _cached_phone_numbers(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached phone-number list if it is still within its TTL."""
+        cached = self._numbers_cache
+        if cached is not None and time.monotonic() - cached[0] < PHONE_NUMBERS_CACHE_TTL:
+            return cached[1]
+        return None
 
-    def delete_phone_number(self, number_id: str) -> None:
+    async def list_phone_numbers(self) -> List[Dict[str, Any]]:
+        """
+        List all phone numbers linked to your Bolna account.
+        Served from a short-lived cache; buying, deleting or attaching a
+        number through this service clears it.
+        """
+        numbers = self._cached_phone_numbers()
+        if numbers is not None:
+            return numbers
+
+        # Concurrent misses wait here and reuse the first caller's result
+        async with self._numbers_lock:
+            numbers = self._cached_phone_numbers()
+            if numbers is not None:
+                return numbers
+            numbers = await self._get("/phone-numbers/all")
+            self._numbers_cache = (time.monotonic(), numbers)
+            return numbers
+
+    async def delete_phone_number(self, number_id: str) -> None:
         """Delete a phone number from Bolna by its ID."""
         logger.info("Deleting phone number %s from Bolna", number_id)
-        response = self.client.delete(f"/phone-numbers/{number_id}")
-        self._check_response(response)
+        try:
+            await self._delete(f"/phone-numbers/{number_id}")
+        finally:
+            # Clear even on failure — a timed-out DELETE may still have gone through
+            self._numbers_cache = None
 
     # ── SIP Trunk Management (BYOT) ─────────────────────────────────── #
 
-    def create_sip_trunk(
+    async def create_sip_trunk(
         self,
         name: str,
         provider: str,
@@ -214,29 +627,37 @@ class BolnaService:
             "gateways": [{"gateway_address": gateway_address}],
             "phone_numbers": [{"phone_number": phone_number}],
             "auth_type": auth_type,
+            # Optional credentials — only sent when given (empty strings are skipped too)
+            **{
+                key: value
+                for key, value in (
+                    ("auth_username", auth_username),
+                    ("auth_password", auth_password),
+                )
+                if value
+            },
         }
-        if auth_username:
-            payload["auth_username"] = auth_username
-        if auth_password:
-            payload["auth_password"] = auth_password
 
         logger.info(
             "Creating SIP trunk in Bolna | number=%s | gateway=%s",
             phone_number, gateway_address,
         )
-        response = self.client.post("/sip-trunks/trunks", json=payload)
+        response = await self.client.post("/sip-trunks/trunks", json=payload)
+        # The trunk's number now shows up in /phone-numbers/all
+        self._numbers_cache = None
         return self._check_response(response)
 
-    def list_sip_trunks(self) -> List[Dict[str, Any]]:
+    async def list_sip_trunks(self) -> List[Dict[str, Any]]:
         """List all SIP trunks connected to your Bolna account."""
-        response = self.client.get("/sip-trunks/trunks")
-        return self._check_response(response)
+        return await self._get("/sip-trunks/trunks")
 
-    def update_sip_trunk(
+    async def update_sip_trunk(
         self, trunk_id: str, updates: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Update an existing SIP trunk configuration."""
-        response = self.client.patch(f"/sip-trunks/trunks/{trunk_id}", json=updates)
+        response = await self.client.patch(f"/sip-trunks/trunks/{trunk_id}", json=updates)
+        # The update can change the trunk's numbers in /phone-numbers/all
+        self._numbers_cache = None
         return self._check_response(response)
 
     # ── Provider Connection (alternative to SIP Trunk) ───────────────── #
@@ -285,7 +706,7 @@ class BolnaService:
             )
         return list(cred_map.keys())
 
-    def connect_provider(
+    async def connect_provider(
         self,
         provider: str,
         credentials: Dict[str, str],
@@ -328,7 +749,7 @@ class BolnaService:
                 provider, bolna_name,
             )
 
-            response = self.client.post("/providers", json={
+            response = await self.client.post("/providers", json={
                 "provider_name": bolna_name,
                 "provider_value": value,
             })
@@ -360,17 +781,15 @@ class BolnaService:
             "details": results,
         }
 
-    def list_providers(self) -> Dict[str, Any]:
+    async def list_providers(self) -> Dict[str, Any]:
         """List all provider credentials stored in Bolna (values are masked)."""
-        response = self.client.get("/providers")
-        return self._check_response(response)
+        return await self._get("/providers", expect=dict)
 
-    def delete_provider(self, provider_id: str) -> Dict[str, Any]:
+    async def delete_provider(self, provider_id: str) -> Dict[str, Any]:
         """Delete a single provider credential from Bolna by its ID."""
-        response = self.client.delete(f"/providers/{provider_id}")
-        return self._check_response(response)
+        return await self._delete(f"/providers/{provider_id}")
 
-    def disconnect_provider(self, provider: str) -> Dict[str, Any]:
+    async def disconnect_provider(self, provider: str) -> Dict[str, Any]:
         """
         Remove ALL credentials for a given provider from Bolna.
         E.g. disconnect_provider("vobiz") deletes VOBIZ_API_KEY,
@@ -385,7 +804,7 @@ class BolnaService:
             )
 
         # Get all credentials currently in Bolna
-        existing = self.client.get("/providers").json()
+        existing = await self.list_providers()
         all_providers = existing.get("providers", [])
 
         # Find and delete all credentials that belong to this provider
@@ -393,7 +812,7 @@ class BolnaService:
         deleted = []
         for p in all_providers:
             if p.get("provider_name") in bolna_keys:
-                resp = self.client.delete(f"/providers/{p['provider_id']}")
+                resp = await self.client.delete(f"/providers/{p['provider_id']}")
                 logger.info(
                     "Deleted credential %s (%s) | status=%s",
                     p["provider_name"], p["provider_id"], resp.status_code,
@@ -414,7 +833,7 @@ class BolnaService:
             "details": deleted,
         }
     # ── Batch Calling ────────────────────────────────────────────────── #
-    def create_batch(
+    async def create_batch(
         self,
         csv_bytes: bytes,
         filename: str,
@@ -460,22 +879,22 @@ class BolnaService:
                 raise BolnaConfigError(f"Failed to process CSV with template: {e}")
         # -------------------------------------------------------------
 
-        logger.info(
-            "Creating batch | agent=%s | file=%s | contacts_approx=%s",
-            resolved_agent_id, filename, final_csv_bytes.count(b"\n"),
-        )
+        # Counting rows scans the whole CSV — only do it when the line is emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Creating batch | agent=%s | file=%s | contacts_approx=%s",
+                resolved_agent_id, filename, final_csv_bytes.count(b"\n"),
+            )
 
-        response = httpx.post(
-            f"{BOLNA_BASE_URL}/batches",
-            headers={"Authorization": f"Bearer {self.api_key}"},
+        response = await self.client.post(
+            "/batches",
             data={"agent_id": resolved_agent_id},
-            files={"file": (filename, final_csv_bytes, "text/csv")}, 
-            timeout=30.0,
+            files={"file": (filename, final_csv_bytes, "text/csv")},
         )
         return self._check_response(response)
 
 
-    def schedule_batch(
+    async def schedule_batch(
         self,
         batch_id: str,
         scheduled_at: str,
@@ -511,29 +930,37 @@ class BolnaService:
             logger.error("Could not parse datetime string: %s", e)
             raise BolnaConfigError(f"Invalid datetime format: {scheduled_at}. Error: {e}")
 
-        # We must use httpx.post directly here as well because self.client has 
-        # Content-Type: application/json forced, but Bolna expects form data here.
-        response = httpx.post(
-            f"{BOLNA_BASE_URL}/batches/{batch_id}/schedule",
-            headers={"Authorization": f"Bearer {self.api_key}"},
+        # Bolna expects form data here, not JSON
+        response = await self.client.post(
+            f"/batches/{batch_id}/schedule",
             data={"scheduled_at": final_iso_time},
-            timeout=30.0,
         )
         return self._check_response(response)
 
-    def get_batch(self, batch_id: str) -> Dict[str, Any]:
-        response = self.client.get(f"/batches/{batch_id}")
-        return self._check_response(response)
+    async def get_batch(self, batch_id: str, raw: bool = False) -> Union[Dict[str, Any], bytes]:
+        return await self._get(f"/batches/{batch_id}", raw=raw)
 
-    def list_batches(self) -> List[Dict[str, Any]]:
-        response = self.client.get("/batches")
-        return self._check_response(response)
+    async def list_batches(self, raw: bool = False) -> Union[List[Dict[str, Any]], bytes]:
+        return await self._get("/batches", raw=raw)
 
-    def stop_batch(self, batch_id: str) -> Dict[str, Any]:
+    async def stop_batch(self, batch_id: str) -> Dict[str, Any]:
         logger.info("Stopping batch | id =%s", batch_id)
-        response = self.client.post(f"/batches/{batch_id}/stop")
+        response = await self.client.post(f"/batches/{batch_id}/stop")
         return self._check_response(response)
 
-    def get_batch_executions(self, batch_id: str) -> List[Dict[str, Any]]:
-        response = self.client.get(f"/batches/{batch_id}/executions")
-        return self._check_response(response)
\ No newline at end of file
+    async def stream_batch_executions(self, batch_id: str) -> AsyncIterator[bytes]:
+        """
+        Yield the raw JSON body of GET /batches/{id}/executions chunk by chunk
+        as it arrives, without buffering or decoding it. Raises before the
+        first chunk if Bolna returns an error status; a transport error later
+        on is raised from the iteration, after some chunks were yielded.
+        """
+        async with self.client.stream("GET", f"/batches/{batch_id}/executions") as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._check_response(response)
+            if "json" not in response.headers.get("content-type", ""):
+                await response.aread()
+                self._require_json(response)
+            async for chunk in response.aiter_bytes():
+                yield chunk
\ No newline at end of file
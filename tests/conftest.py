@@ -0,0 +1,10 @@
+"""
+Shared test setup — the Bolna settings are read once at import (app/config.py),
+so test values must be in the environment before any app module is imported.
+"""
+
+import os
+
+os.environ.setdefault("BOLNA_API_KEY", "test-key")
+os.environ.setdefault("BOLNA_AGENT_ID", "test-agent")
+os.environ.setdefault("BOLNA_FROM_NUMBER", "+910000000000")
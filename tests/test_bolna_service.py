@@ -0,0 +1,261 @@
+"""
+BolnaService — outbound call dispatcher (micro-batching queue).
+
+Bolna is replaced by an httpx.MockTransport, so no network is used.
+"""
+
+import asyncio
+import time
+
+import httpx
+import orjson
+import pytest
+from tenacity import RetryCallState, wait_none
+
+import services.bolna_service as bolna_service
+from services.bolna_service import BolnaAPIError, BolnaConfigError, BolnaService
+
+
+def make_service(handler) -> BolnaService:
+    """A BolnaService whose HTTP client is served by `handler(request)`."""
+    service = BolnaService()
+    service._client = httpx.AsyncClient(
+        base_url="https://bolna.test", transport=httpx.MockTransport(handler)
+    )
+    return service
+
+
+def echo_call(delay: float = 0.0):
+    """Async handler answering POST /call with the recipient as execution_id."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if delay:
+            await asyncio.sleep(delay)
+        to_number = orjson.loads(request.content)["recipient_phone_number"]
+        if to_number == "+400":
+            return httpx.Response(400, json={"message": "invalid number"})
+        return httpx.Response(200, json={"execution_id": f"exec{to_number}", "status": "queued"})
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_lone_call_is_sent_without_waiting_for_the_window(monkeypatch):
+    monkeypatch.setattr(bolna_service, "BOLNA_CALL_BATCH_WINDOW_MS", 1000)
+    service = make_service(echo_call())
+
+    started = time.monotonic()
+    result = await service.initiate_call("+1")
+
+    assert result["execution_id"] == "exec+1"
+    assert time.monotonic() - started < 0.5
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_each_get_their_own_response():
+    service = make_service(echo_call(delay=0.01))
+
+    numbers = [f"+{i}" for i in range(25)]
+    results = await asyncio.gather(*(service.initiate_call(n) for n in numbers))
+
+    assert [r["execution_id"] for r in results] == [f"exec{n}" for n in numbers]
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_call_only_fails_its_own_caller():
+    service = make_service(echo_call())
+
+    results = await asyncio.gather(
+        service.initiate_call("+1"),
+        service.initiate_call("+400"),
+        service.initiate_call("+2"),
+        return_exceptions=True,
+    )
+
+    assert results[0]["execution_id"] == "exec+1"
+    assert isinstance(results[1], BolnaAPIError) and results[1].status_code == 400
+    assert results[2]["execution_id"] == "exec+2"
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_the_burst():
+    service = make_service(echo_call(delay=0.05))
+
+    cancelled = asyncio.create_task(service.initiate_call("+1"))
+    others = [asyncio.create_task(service.initiate_call(f"+{i}")) for i in (2, 3)]
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+
+    results = await asyncio.gather(*others)
+    assert [r["execution_id"] for r in results] == ["exec+2", "exec+3"]
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_fails_calls_that_were_never_sent(monkeypatch):
+    # A long window keeps the burst in the dispatcher, unsent
+    monkeypatch.setattr(bolna_service, "BOLNA_CALL_BATCH_WINDOW_MS", 10_000)
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"execution_id": "x"})
+
+    service = make_service(handler)
+    calls = [asyncio.create_task(service.initiate_call(f"+{i}")) for i in range(3)]
+    await asyncio.sleep(0.01)
+
+    await service.aclose()
+
+    results = await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), timeout=1)
+    assert all(isinstance(r, BolnaConfigError) for r in results)
+    assert sent == []
+
+
+@pytest.mark.asyncio
+async def test_aclose_lets_sent_calls_finish():
+    service = make_service(echo_call(delay=0.05))
+
+    call = asyncio.create_task(service.initiate_call("+1"))
+    await asyncio.sleep(0.01)
+    await service.aclose()
+
+    assert (await call)["execution_id"] == "exec+1"
+
+
+@pytest.mark.asyncio
+async def test_bulk_call_retries_busy_answers_in_one_layer(monkeypatch):
+    monkeypatch.setattr(BolnaService._post_call_with_backoff.retry, "wait", wait_none())
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(429, json={"message": "slow down"})
+
+    service = make_service(handler)
+    [result] = await service.initiate_calls_bulk([{"to_number": "+1"}])
+
+    assert isinstance(result, BolnaAPIError) and result.status_code == 429
+    assert len(attempts) == bolna_service.BULK_MAX_ATTEMPTS
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_delete_is_not_retried_once_bolna_has_answered():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(502, json={"message": "bad gateway"})
+
+    service = make_service(handler)
+    with pytest.raises(BolnaAPIError):
+        await service.delete_phone_number("num_1")
+
+    assert len(attempts) == 1
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_listing_endpoints_pass_non_list_bodies_through():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": []})
+
+    service = make_service(handler)
+    assert await service.list_sip_trunks() == {"data": []}
+    assert await service.list_phone_numbers() == {"data": []}
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_results_keep_spec_order_and_isolate_failures():
+    service = make_service(echo_call())
+
+    results = await service.initiate_calls_bulk(
+        [{"to_number": "+1"}, {"to_number": "+400"}, {"to_number": "+2", "agent_id": "agent-2"}]
+    )
+
+    assert results[0]["execution_id"] == "exec+1"
+    assert isinstance(results[1], BolnaAPIError) and results[1].status_code == 400
+    assert results[2]["execution_id"] == "exec+2"
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_prepare_dialer_sends_fixed_settings_and_escaped_number():
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(orjson.loads(request.content))
+        return httpx.Response(200, json={"execution_id": "x"})
+
+    service = make_service(handler)
+    dial = service.prepare_dialer(agent_id="agent-7", from_number="+9100")
+    await dial('+1"2')
+
+    assert bodies == [{
+        "agent_id": "agent-7",
+        "from_phone_number": "+9100",
+        "recipient_phone_number": '+1"2',
+    }]
+    await service.aclose()
+
+
+def test_bulk_call_backoff_is_jittered():
+    # Calls rejected together must not all retry at the same instant
+    wait = BolnaService._post_call_with_backoff.retry.wait
+    state = RetryCallState(retry_object=None, fn=None, args=(), kwargs={})
+    state.attempt_number = 1
+
+    delays = {wait(state) for _ in range(50)}
+
+    assert len(delays) > 1
+    assert all(bolna_service.BULK_BACKOFF_BASE_SECONDS <= d <= 2.0 for d in delays)
+
+
+@pytest.mark.asyncio
+async def test_sip_trunk_update_invalidates_phone_number_cache():
+    listed = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            listed.append(request)
+            return httpx.Response(200, json=[{"phone_number": f"+{len(listed)}"}])
+        return httpx.Response(200, json={"id": "trunk_1"})
+
+    service = make_service(handler)
+    await service.list_phone_numbers()
+    await service.update_sip_trunk("trunk_1", {"phone_numbers": ["+2"]})
+
+    assert await service.list_phone_numbers() == [{"phone_number": "+2"}]
+    assert len(listed) == 2
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", [
+    httpx.Response(200, html="<html>proxy error</html>"),
+    httpx.Response(200, headers={"content-type": "application/json"}),
+])
+async def test_raw_pass_through_rejects_non_json_bodies(response, monkeypatch):
+    monkeypatch.setattr(BolnaService._get.retry, "wait", wait_none())
+    service = make_service(lambda request: response)
+
+    with pytest.raises(BolnaAPIError) as exc:
+        await service.get_batch("batch_1", raw=True)
+
+    assert exc.value.status_code == 502
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_raw_pass_through_returns_json_bytes_undecoded():
+    service = make_service(lambda request: httpx.Response(200, json={"batch_id": "batch_1"}))
+
+    body = await service.get_batch("batch_1", raw=True)
+
+    assert isinstance(body, bytes) and orjson.loads(body) == {"batch_id": "batch_1"}
+    await service.aclose()
@@ -0,0 +1,78 @@
+"""
+app.migrate_calls_public_id — rebuild of a pre-public_id calls table.
+
+Runs against a throwaway SQLite file laid out like the databases created
+before the integer primary key.
+"""
+
+import sqlite3
+
+import pytest
+
+from app.migrate_calls_public_id import run
+
+LEGACY_SCHEMA = """
+CREATE TABLE calls (
+    id VARCHAR NOT NULL,
+    lead_id VARCHAR,
+    lead_name VARCHAR,
+    lead_phone VARCHAR,
+    bolna_execution_id VARCHAR,
+    status VARCHAR,
+    transcript TEXT,
+    call_summary TEXT,
+    recording_url VARCHAR,
+    duration_ms INTEGER,
+    created_at DATETIME,
+    interest_level VARCHAR,
+    callback_requested BOOLEAN,
+    callback_time VARCHAR,
+    stop_sequence BOOLEAN,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_calls_bolna_execution_id ON calls (bolna_execution_id);
+"""
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO calls (id, lead_name, bolna_execution_id, status, transcript, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("uuid-b", "Bea", "exec-b", "completed", "hello", "2026-01-02 10:00:00"),
+            ("uuid-a", "Ana", None, "queued", None, "2026-01-01 10:00:00"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.mark.parametrize("scheme", ["sqlite", "sqlite+aiosqlite"])
+def test_migrates_legacy_calls_and_keeps_their_ids(legacy_db, scheme):
+    url = f"{scheme}:///{legacy_db}"
+
+    assert run(url) == 2
+
+    conn = sqlite3.connect(legacy_db)
+    rows = conn.execute(
+        "SELECT id, public_id, lead_name, bolna_execution_id, status, transcript FROM calls ORDER BY id"
+    ).fetchall()
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    conn.close()
+
+    # Integer ids follow created_at; the old UUIDs become public_id
+    assert rows == [
+        (1, "uuid-a", "Ana", None, "queued", None),
+        (2, "uuid-b", "Bea", "exec-b", "completed", "hello"),
+    ]
+    assert "calls_legacy" not in tables
+    assert {"ix_calls_public_id", "ix_calls_bolna_execution_id", "ix_calls_bolna_created_at"} <= indexes
+
+    # Second run is a no-op
+    assert run(url) == 0